@@ -5,10 +5,11 @@ to convert stack-trace/exceptions into STDERR message and non-zero exit codes.
 """
 
 import os
+import re
 import sys
 import shutil
 import typing
-import filecmp
+import concurrent.futures
 import pathlib
 import argparse
 
@@ -115,6 +116,33 @@ def main(
     )
 
 
+def _directory_files(directory: pathlib.Path) -> typing.List[pathlib.Path]:
+    """Recursively list the files in ``directory``
+
+    Equivalent to ``[path for path in directory.rglob("*") if path.is_file()]``, but uses the file type cached on the
+    ``os.scandir`` entries instead of a ``stat`` call per path. Symbolic links to directories are not followed and
+    unreadable directories are skipped.
+
+    :param directory: Directory to search
+
+    :returns: files
+    """
+    files = []
+    directories = [directory]
+    while directories:
+        try:
+            scandir_iterator = os.scandir(directories.pop())
+        except PermissionError:
+            continue
+        with scandir_iterator as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(pathlib.Path(entry.path))
+                elif entry.is_file():
+                    files.append(pathlib.Path(entry.path))
+    return files
+
+
 def available_files(
     root_directory: typing.Union[str, pathlib.Path],
     relative_paths: typing.Iterable[typing.Union[str, pathlib.Path]],
@@ -142,14 +170,15 @@ def available_files(
         if absolute_path.is_file():
             file_list.append(absolute_path)
         elif absolute_path.is_dir():
-            file_list = [path for path in absolute_path.rglob("*") if path.is_file()]
+            file_list = _directory_files(absolute_path)
         else:
             file_list = [path for path in root_directory.rglob(str(relative_path)) if path.is_file()]
         if file_list:
             available_files.extend(file_list)
         else:
             not_found.append(relative_path)
-    available_files.sort()
+    # Overlapping relative paths, e.g. a directory and a file inside it, find the same file more than once
+    available_files = sorted(set(available_files))
     not_found.sort()
     return available_files, not_found
 
@@ -174,7 +203,11 @@ def build_source_files(
     """
     # TODO: Save the list of excluded files and return
     source_files, not_found = available_files(root_directory, relative_paths)
-    source_files = [path for path in source_files if not any(map(str(path).__contains__, exclude_patterns))]
+    exclude_patterns = tuple(exclude_patterns)
+    if exclude_patterns:
+        # Single pass over each path string instead of one substring search per pattern
+        exclude_regex = re.compile("|".join(map(re.escape, exclude_patterns)))
+        source_files = [path for path in source_files if not exclude_regex.search(str(path))]
     return source_files, not_found
 
 
@@ -234,28 +267,67 @@ def build_copy_tuples(
         for requested_path, destination_file in zip(requested_paths_resolved, destination_files)
     ]
     if not overwrite and existing_files:
+        existing_set = set(existing_files)
         copy_tuples = [
             (requested_path, destination_file)
             for requested_path, destination_file in copy_tuples
-            if destination_file not in existing_files
+            if destination_file not in existing_set
         ]
     return copy_tuples
 
 
+def _files_equal(first: pathlib.Path, second: pathlib.Path, buffer_size: int = 128 * 1024) -> bool:
+    """Compare the byte contents of two files
+
+    Replaces ``filecmp.cmp(first, second, shallow=False)``. A missing ``second`` file or files with different sizes are
+    unequal without reading their contents. Otherwise, both files are read in ``buffer_size`` blocks, which is larger
+    than the ``filecmp`` default.
+
+    :param first: First file to compare
+    :param second: Second file to compare
+    :param buffer_size: Number of bytes to read from each file per comparison
+
+    :returns: True if the file contents are identical, False otherwise
+    """
+    # One stat call on the second file doubles as the existence check
+    try:
+        second_size = os.path.getsize(second)
+    except FileNotFoundError:
+        return False
+    if os.path.getsize(first) != second_size:
+        return False
+    with open(first, "rb") as first_file, open(second, "rb") as second_file:
+        while True:
+            first_block = first_file.read(buffer_size)
+            if first_block != second_file.read(buffer_size):
+                return False
+            if not first_block:
+                return True
+
+
 def conditional_copy(copy_tuples: typing.List[typing.Tuple[pathlib.Path, pathlib.Path]]) -> None:
     """Copy when destination file doesn't exist or doesn't match source file content
 
     Uses Python ``shutil.copyfile``, so meta data isn't preserved. Creates intermediate parent directories prior to
-    copy, but doesn't raise exceptions on existing parent directories.
+    copy, but doesn't raise exceptions on existing parent directories. The file comparisons and copies are I/O bound
+    and run in a thread pool.
 
     :param copy_tuples: Tuple of source, destination pathlib.Path pairs, e.g. ``((source, destination), ...)``
     """
-    for source_file, destination_file in copy_tuples:
+
+    def copy_if_different(copy_tuple: typing.Tuple[pathlib.Path, pathlib.Path]) -> None:
+        source_file, destination_file = copy_tuple
         # If the root_directory and destination file contents are the same, don't perform unnecessary file I/O
-        if not destination_file.exists() or not filecmp.cmp(source_file, destination_file, shallow=False):
-            destination_file.parent.mkdir(parents=True, exist_ok=True)
+        if not _files_equal(source_file, destination_file):
             shutil.copyfile(source_file, destination_file)
 
+    # Create the parent directories serially to avoid racing directory creation in the thread pool
+    for parent in dict.fromkeys(destination_file.parent for _, destination_file in copy_tuples):
+        parent.mkdir(parents=True, exist_ok=True)
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        # Consume the results to raise any exceptions from the worker threads
+        list(executor.map(copy_if_different, copy_tuples))
+
 
 def print_list(things_to_print: list, prefix: str = "\t", stream=sys.stdout) -> None:
     """Print a list to the specified stream, one line per item
@@ -11,6 +11,7 @@ import sys
 import typing
 import pathlib
 import argparse
+import functools
 
 import yaml
 
@@ -20,10 +21,24 @@ from waves import parameter_generators
 
 _exclude_from_namespace = set(globals().keys())
 
+# Prefer the libyaml C implementation when PyYAML was built against it
+_yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+_available_parameter_generators = {
+    _settings._cartesian_product_subcommand: parameter_generators.CartesianProduct,
+    _settings._custom_study_subcommand: parameter_generators.CustomStudy,
+    _settings._latin_hypercube_subcommand: parameter_generators.LatinHypercube,
+    _settings._sobol_sequence_subcommand: parameter_generators.SobolSequence,
+}
+
+
+@functools.lru_cache(maxsize=1)
 def get_parser() -> argparse.ArgumentParser:
     """Return a 'no-help' parser for the parameter study subcommand(s)
 
+    The parser is built once and shared by every parameter study subcommand as a parent parser. Callers must not
+    modify the returned parser.
+
     :return: parser
     """
     # Required positional option
@@ -31,8 +46,12 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "INPUT_FILE",
         nargs="?",
-        default=(None if sys.stdin.isatty() else sys.stdin),
-        help="YAML formatted parameter study schema file (default: STDIN)",
+        default=None,
+        # fmt: off
+        help="YAML formatted parameter study schema file. Files larger than "
+             f"{_settings._parameter_schema_maximum_bytes // 1024**2} MiB are rejected. STDIN is not size checked "
+             "(default: STDIN)",
+        # fmt: on
     )
 
     # Mutually exclusive output file options
@@ -122,22 +141,31 @@ def get_parser() -> argparse.ArgumentParser:
 def read_parameter_schema(input_file: typing.Union[str, pathlib.Path, io.TextIOWrapper, None]) -> dict:
     """Read a YAML dictionary from STDIN or a file
 
-    :param input_file: STDIN stream or file path
+    :param input_file: STDIN stream or file path. If None, read from STDIN when STDIN is not a terminal. File paths are
+        limited to ``_settings._parameter_schema_maximum_bytes``. STDIN is not size checked.
 
     :returns: dictionary
 
-    :raises RuntimeError: if not STDIN and the file name does not exist
+    :raises RuntimeError: if not STDIN and the file name does not exist or the file is too large
     """
+    if input_file is None and not sys.stdin.isatty():
+        input_file = typing.cast(io.TextIOWrapper, sys.stdin)
     if input_file is None:
         raise RuntimeError("Require an input file path or a YAML formatted string on STDIN")
     if isinstance(input_file, io.TextIOWrapper):
-        parameter_schema = yaml.safe_load(input_file)
+        parameter_schema = yaml.load(input_file, Loader=_yaml_loader)
     else:
         input_file = pathlib.Path(input_file)
         if not input_file.is_file():
             raise RuntimeError(f"File '{input_file}' does not exist.")
+        file_stat = input_file.stat()
+        if file_stat.st_size > _settings._parameter_schema_maximum_bytes:
+            raise RuntimeError(
+                f"File '{input_file}' size {file_stat.st_size} bytes exceeds the parameter schema limit of "
+                f"{_settings._parameter_schema_maximum_bytes} bytes."
+            )
         with open(input_file, "r") as input_handle:
-            parameter_schema = yaml.safe_load(input_handle)
+            parameter_schema = yaml.load(input_handle, Loader=_yaml_loader)
     return parameter_schema
 
 
@@ -173,13 +201,7 @@ def main(
         raise RuntimeError(f"Error loading '{input_file}'. Check the YAML syntax.\nyaml.parser.ParserError: {err}")
 
     # Retrieve and instantiate the subcommand class
-    available_parameter_generators = {
-        _settings._cartesian_product_subcommand: parameter_generators.CartesianProduct,
-        _settings._custom_study_subcommand: parameter_generators.CustomStudy,
-        _settings._latin_hypercube_subcommand: parameter_generators.LatinHypercube,
-        _settings._sobol_sequence_subcommand: parameter_generators.SobolSequence,
-    }
-    parameter_generator = available_parameter_generators[subcommand](
+    parameter_generator = _available_parameter_generators[subcommand](
         parameter_schema,
         output_file_template=output_file_template,
         output_file=output_file,
@@ -48,6 +48,7 @@ _default_write_meta = False
 _default_output_file_template = None
 _default_output_file = None
 _parameter_study_meta_file = "parameter_study_meta.txt"
+_parameter_schema_maximum_bytes = 64 * 1024**2
 _allowable_output_file_typing = typing.Literal["h5", "yaml"]
 _allowable_output_file_types = typing.get_args(_allowable_output_file_typing)
 _default_output_file_type_api = _allowable_output_file_types[0]
@@ -1,6 +1,7 @@
+import io
 import sys
 import pathlib
-from unittest.mock import Mock
+from unittest.mock import Mock, MagicMock
 from unittest.mock import patch, call
 from contextlib import nullcontext as does_not_raise
 
@@ -28,6 +29,7 @@ one_file_copy_tuples = ((one_file_source_tree[0], one_file_destination_tree[0]),
 
 two_file_source_tree = [root_directory / path for path in source_files]
 two_file_destination_tree = [destination / path for path in source_files]
+two_file_copy_tuples = tuple(zip(two_file_source_tree, two_file_destination_tree))
 
 
 def test_fetch():
@@ -58,52 +60,111 @@ def test_fetch_settings():
     assert tuple(_settings._tutorial_paths.keys()) == _settings._allowable_tutorial_numbers
 
 
+files_equal_input = {
+    "different sizes": ((1, 2), [], False),
+    "identical contents": ((4, 4), [b"same", b"same"], True),
+    "different contents": ((5, 5), [b"first", b"other"], False),
+    "empty files": ((0, 0), [b"", b""], True),
+    "missing second file": (FileNotFoundError(), [], False),
+}
+
+
+@pytest.mark.parametrize(
+    "sizes, contents, expected",
+    files_equal_input.values(),
+    ids=files_equal_input.keys(),
+)
+def test_files_equal(sizes, contents, expected):
+    with (
+        patch("os.path.getsize", side_effect=sizes),
+        patch("builtins.open", side_effect=[io.BytesIO(content) for content in contents]) as mock_open,
+    ):
+        assert _fetch._files_equal("first", "second", buffer_size=2) is expected
+    if contents:
+        assert mock_open.call_count == 2
+    else:
+        mock_open.assert_not_called()
+
+
 conditional_copy_input = {
-    "one new file": (  # File does not exist
+    "one new or different file": (  # File does not exist or is different from the source file
         one_file_copy_tuples,
         [False],
-        [False],
-        one_file_copy_tuples[0],
-    ),
-    "one different file": (  # File does exist, but it's different from the source file
-        one_file_copy_tuples,
-        [True],
-        [False],
-        one_file_copy_tuples[0],
+        [one_file_copy_tuples[0]],
     ),
     "one identical file": (  # File exists and is identical to source file
         one_file_copy_tuples,
         [True],
-        [True],
-        None,
+        [],
     ),
-    "one missing (different) file": (  # File doesn't exist and is identical to source file. Should never actually occur
-        one_file_copy_tuples,
-        [False],
-        [True],
-        one_file_copy_tuples[0],
+    "two new or different files with a shared parent": (  # Parent directory is created once
+        two_file_copy_tuples,
+        [False, False],
+        list(two_file_copy_tuples),
     ),
 }
 
 
 @pytest.mark.parametrize(
-    "copy_tuples, exists_side_effect, filecmp_side_effect, copyfile_call",
+    "copy_tuples, files_equal_side_effect, copyfile_calls",
     conditional_copy_input.values(),
     ids=conditional_copy_input.keys(),
 )
-def test_conditional_copy(copy_tuples, exists_side_effect, filecmp_side_effect, copyfile_call):
+def test_conditional_copy(copy_tuples, files_equal_side_effect, copyfile_calls):
     with (
-        patch("pathlib.Path.exists", side_effect=exists_side_effect),
-        patch("filecmp.cmp", side_effect=filecmp_side_effect),
+        patch("waves._fetch._files_equal", side_effect=files_equal_side_effect),
         patch("pathlib.Path.mkdir") as mock_mkdir,
         patch("shutil.copyfile") as mock_copyfile,
     ):
         _fetch.conditional_copy(copy_tuples)
-        if copyfile_call:
-            mock_mkdir.assert_called_once()
-            mock_copyfile.assert_called_once_with(*copyfile_call)
-        else:
-            mock_copyfile.assert_not_called()
+        assert mock_mkdir.call_count == 1
+        assert mock_copyfile.call_count == len(copyfile_calls)
+        mock_copyfile.assert_has_calls([call(*copyfile_call) for copyfile_call in copyfile_calls], any_order=True)
+
+
+def test_conditional_copy_exception():
+    """Check that exceptions raised while comparing or copying files reach the caller"""
+    with (
+        patch("waves._fetch._files_equal", side_effect=PermissionError("dummy")),
+        patch("pathlib.Path.mkdir"),
+        patch("shutil.copyfile") as mock_copyfile,
+        pytest.raises(PermissionError),
+    ):
+        _fetch.conditional_copy(one_file_copy_tuples)
+    mock_copyfile.assert_not_called()
+
+
+def test_directory_files():
+    """Check the recursive directory walk returns files and skips directory symbolic links and unreadable directories"""
+
+    def mock_entry(path, is_dir=False, is_file=False):
+        entry = Mock(path=str(path))
+        entry.is_dir.return_value = is_dir
+        entry.is_file.return_value = is_file
+        return entry
+
+    subdirectory = root_directory / "subdirectory"
+    unreadable = root_directory / "unreadable"
+    scandir_entries = {
+        root_directory: [
+            mock_entry(root_directory / "dummy.file1", is_file=True),
+            mock_entry(subdirectory, is_dir=True),
+            mock_entry(unreadable, is_dir=True),
+            mock_entry(root_directory / "directory_link"),
+        ],
+        subdirectory: [mock_entry(subdirectory / "dummy.file2", is_file=True)],
+    }
+
+    def mock_scandir(directory):
+        if directory == unreadable:
+            raise PermissionError(f"Permission denied: '{directory}'")
+        entries = MagicMock()
+        entries.__enter__.return_value = scandir_entries[directory]
+        return entries
+
+    with patch("os.scandir", side_effect=mock_scandir):
+        files = _fetch._directory_files(root_directory)
+    assert sorted(files) == [root_directory / "dummy.file1", subdirectory / "dummy.file2"]
 
 
 available_files_input = {
@@ -113,6 +174,7 @@ available_files_input = {
         [True],
         [False],
         [],
+        [],
         one_file_source_tree,
         [],
         None,
@@ -123,6 +185,7 @@ available_files_input = {
         [True],
         [False],
         [],
+        [],
         one_file_source_tree,
         [],
         None,
@@ -134,6 +197,7 @@ available_files_input = {
         [False],
         [[]],
         [],
+        [],
         ["dummy.file1"],
         "dummy.file1",
     ),
@@ -143,29 +207,43 @@ available_files_input = {
         [True, True],
         [],
         [],
+        [],
         two_file_source_tree,
         [],
         None,
     ),
+    "duplicate files": (
+        "/path/to/source",
+        ["dummy.file1", "dummy.file1"],
+        [True, True],
+        [],
+        [],
+        [],
+        one_file_source_tree,
+        [],
+        None,
+    ),
     "one directory, one file": (
         "/path/to",
         "source",
-        [False, True],
+        [False],
         [True],
+        [],
         [one_file_source_tree],
         one_file_source_tree,
         [],
-        "*",
+        None,
     ),
     "one directory, two files": (
         "/path/to",
         "source",
-        [False, True, True],
+        [False],
         [True],
+        [],
         [two_file_source_tree],
         two_file_source_tree,
         [],
-        "*",
+        None,
     ),
     "two files, rglob pattern": (
         "/path/to/source",
@@ -173,6 +251,7 @@ available_files_input = {
         [False, True, True],
         [False],
         [two_file_source_tree],
+        [],
         two_file_source_tree,
         [],
         "dummy.file*",
@@ -181,7 +260,7 @@ available_files_input = {
 
 
 @pytest.mark.parametrize(
-    "root_directory, relative_paths, is_file_side_effect, is_dir_side_effect, rglob_side_effect, expected_files, expected_missing, mock_rglob_argument",  # noqa: E501
+    "root_directory, relative_paths, is_file_side_effect, is_dir_side_effect, rglob_side_effect, directory_files_side_effect, expected_files, expected_missing, mock_rglob_argument",  # noqa: E501
     available_files_input.values(),
     ids=available_files_input.keys(),
 )
@@ -191,6 +270,7 @@ def test_available_files(
     is_file_side_effect,
     is_dir_side_effect,
     rglob_side_effect,
+    directory_files_side_effect,
     expected_files,
     expected_missing,
     mock_rglob_argument,
@@ -199,6 +279,7 @@ def test_available_files(
         patch("pathlib.Path.is_file", side_effect=is_file_side_effect),
         patch("pathlib.Path.is_dir", side_effect=is_dir_side_effect),
         patch("pathlib.Path.rglob", side_effect=rglob_side_effect) as mock_rglob,
+        patch("waves._fetch._directory_files", side_effect=directory_files_side_effect),
     ):
         available_files, not_found = _fetch.available_files(root_directory, relative_paths)
         assert available_files == expected_files
@@ -231,6 +312,20 @@ build_source_files_input = {
         ([one_file_source_tree[0], pathlib.Path("/path/to/source/matched")], []),
         one_file_source_tree,
     ),
+    "no exclude patterns": (
+        "/path/to/source",
+        ["dummy.file1"],
+        [],
+        (one_file_source_tree, []),
+        one_file_source_tree,
+    ),
+    "literal pattern characters": (
+        "/path/to/source",
+        ["dummy.file1", "dummyXfile2"],
+        [".file"],
+        ([one_file_source_tree[0], pathlib.Path("/path/to/source/dummyXfile2")], []),
+        [pathlib.Path("/path/to/source/dummyXfile2")],
+    ),
 }
 
 
@@ -374,7 +469,7 @@ def test_recursive_copy(root_directory, source_files, source_tree, destination_t
         patch("waves._fetch.print_list") as mock_print_list,
         patch("waves._fetch.conditional_copy") as mock_conditional_copy,
         patch("pathlib.Path.exists", side_effect=[False, False]),
-        patch("filecmp.cmp", return_value=False),
+        patch("waves._fetch._files_equal", return_value=False),
         does_not_raise(),
     ):
         _fetch.recursive_copy(root_directory.parent, root_directory.name, destination)
@@ -387,7 +482,7 @@ def test_recursive_copy(root_directory, source_files, source_tree, destination_t
         patch("waves._fetch.print_list") as mock_print_list,
         patch("waves._fetch.conditional_copy") as mock_conditional_copy,
         patch("pathlib.Path.exists", side_effect=[False, False]),
-        patch("filecmp.cmp", return_value=False),
+        patch("waves._fetch._files_equal", return_value=False),
         does_not_raise(),
     ):
         _fetch.recursive_copy(
@@ -402,7 +497,7 @@ def test_recursive_copy(root_directory, source_files, source_tree, destination_t
         patch("waves._fetch.print_list") as mock_print_list,
         patch("waves._fetch.conditional_copy") as mock_conditional_copy,
         patch("pathlib.Path.exists", side_effect=[False, False]),
-        patch("filecmp.cmp", return_value=False),
+        patch("waves._fetch._files_equal", return_value=False),
         does_not_raise(),
     ):
         _fetch.recursive_copy(root_directory.parent, root_directory.name, destination, dry_run=True)
@@ -415,7 +510,7 @@ def test_recursive_copy(root_directory, source_files, source_tree, destination_t
         patch("waves._fetch.print_list") as mock_print_list,
         patch("waves._fetch.conditional_copy") as mock_conditional_copy,
         patch("pathlib.Path.exists", side_effect=[False, False]),
-        patch("filecmp.cmp", return_value=False),
+        patch("waves._fetch._files_equal", return_value=False),
         does_not_raise(),
     ):
         _fetch.recursive_copy(root_directory.parent, root_directory.name, destination, print_available=True)
@@ -429,7 +524,7 @@ def test_recursive_copy(root_directory, source_files, source_tree, destination_t
         patch("waves._fetch.print_list") as mock_print_list,
         patch("waves._fetch.conditional_copy") as mock_conditional_copy,
         patch("pathlib.Path.exists", side_effect=[True, True]),
-        patch("filecmp.cmp", return_value=True),
+        patch("waves._fetch._files_equal", return_value=True),
         does_not_raise(),
     ):
         _fetch.recursive_copy(root_directory.parent, root_directory.name, destination)
@@ -442,7 +537,7 @@ def test_recursive_copy(root_directory, source_files, source_tree, destination_t
         patch("waves._fetch.print_list") as mock_print_list,
         patch("waves._fetch.conditional_copy") as mock_conditional_copy,
         patch("pathlib.Path.exists", side_effect=[True, True]),
-        patch("filecmp.cmp", return_value=False),
+        patch("waves._fetch._files_equal", return_value=False),
         does_not_raise(),
     ):
         _fetch.recursive_copy(root_directory.parent, root_directory.name, destination, overwrite=True)
@@ -456,7 +551,7 @@ def test_recursive_copy(root_directory, source_files, source_tree, destination_t
         patch("waves._fetch.print_list") as mock_print_list,
         patch("waves._fetch.conditional_copy") as mock_conditional_copy,
         patch("pathlib.Path.exists", side_effect=[True, True]),
-        patch("filecmp.cmp", return_value=True),
+        patch("waves._fetch._files_equal", return_value=True),
         does_not_raise(),
     ):
         _fetch.recursive_copy(root_directory.parent, root_directory.name, destination, overwrite=True)
@@ -470,7 +565,7 @@ def test_recursive_copy(root_directory, source_files, source_tree, destination_t
         patch("waves._fetch.print_list") as mock_print_list,
         patch("waves._fetch.conditional_copy") as mock_conditional_copy,
         patch("pathlib.Path.exists", side_effect=[True, True]),
-        patch("filecmp.cmp", return_value=True),
+        patch("waves._fetch._files_equal", return_value=True),
         does_not_raise(),
     ):
         _fetch.recursive_copy(root_directory.parent, root_directory.name, destination, overwrite=True, dry_run=True)
@@ -484,7 +579,7 @@ def test_recursive_copy(root_directory, source_files, source_tree, destination_t
         patch("waves._fetch.extend_requested_paths") as mock_extend,
         patch("waves._fetch.conditional_copy"),
         patch("pathlib.Path.exists", side_effect=[False, False]),
-        patch("filecmp.cmp", return_value=False),
+        patch("waves._fetch._files_equal", return_value=False),
         does_not_raise(),
     ):
         _fetch.recursive_copy(root_directory.parent, root_directory.name, destination, tutorial=tutorial)
@@ -8,6 +8,7 @@ import pytest
 
 from waves import _main
 from waves import _settings
+from waves import _parameter_study
 from waves import exceptions
 
 
@@ -141,9 +142,11 @@ def test_parameter_study(subcommand, class_name, argument, option, argument_valu
     with (
         patch("sys.argv", arg_list),
         patch("builtins.open", mock_open()),
-        patch("yaml.safe_load"),
+        patch("yaml.load"),
         patch(f"waves.parameter_generators.{class_name}") as mock_generator,
+        patch.dict(_parameter_study._available_parameter_generators, {subcommand: mock_generator}),
         patch("pathlib.Path.is_file", return_value=True),
+        patch("pathlib.Path.stat", return_value=Mock(st_size=0)),
         does_not_raise(),
     ):
         _main.main()
@@ -6,7 +6,9 @@ from contextlib import nullcontext as does_not_raise
 import pytest
 import yaml
 
+from waves import _settings
 from waves import _parameter_study
+from waves import parameter_generators
 
 
 def test_read_parameter_schema():
@@ -22,8 +24,9 @@ def test_read_parameter_schema():
     input_file = pathlib.Path("dummy.yaml")
     with (
         patch("pathlib.Path.is_file", return_value=True),
+        patch("pathlib.Path.stat", return_value=Mock(st_size=1)),
         patch("builtins.open", mock_open()) as mock_file,
-        patch("yaml.safe_load", return_value=expected),
+        patch("yaml.load", return_value=expected),
     ):
         parameter_schema = _parameter_study.read_parameter_schema(input_file)
     mock_file.assert_called_once_with(input_file, "r")
@@ -38,8 +41,20 @@ def test_read_parameter_schema():
         parameter_schema = _parameter_study.read_parameter_schema(input_file)
     mock_file.assert_not_called()
 
+    # Test RuntimeError on oversized file
+    oversized = _settings._parameter_schema_maximum_bytes + 1
+    with (
+        patch("pathlib.Path.is_file", return_value=True),
+        patch("pathlib.Path.stat", return_value=Mock(st_size=oversized)),
+        patch("builtins.open", mock_open()) as mock_file,
+        pytest.raises(RuntimeError),
+    ):
+        parameter_schema = _parameter_study.read_parameter_schema(input_file)
+    mock_file.assert_not_called()
+
     # Test RuntimeError on missing STDIN and missing file
     with (
+        patch("sys.stdin.isatty", return_value=True),
         patch("pathlib.Path.is_file", return_value=False),
         patch("builtins.open", mock_open()) as mock_file,
         pytest.raises(RuntimeError),
@@ -47,6 +62,16 @@ def test_read_parameter_schema():
         parameter_schema = _parameter_study.read_parameter_schema(None)
     mock_file.assert_not_called()
 
+    # Test STDIN read when no input file is provided
+    stdin = io.TextIOWrapper(io.BytesIO(b"{a: [1], b: [2]}"))
+    with (
+        patch("sys.stdin", stdin),
+        patch("builtins.open", mock_open()) as mock_file,
+    ):
+        parameter_schema = _parameter_study.read_parameter_schema(None)
+    mock_file.assert_not_called()
+    assert parameter_schema == expected
+
 
 def test_main():
     # Check the YAML read error and clarification runtime error message
@@ -68,10 +93,12 @@ def test_main():
         ("sobol_sequence", "SobolSequence"),
     )
     for subcommand, generator in associations:
+        assert _parameter_study._available_parameter_generators[subcommand] is getattr(parameter_generators, generator)
         mock_generator = Mock()
         with (
             patch("waves._parameter_study.read_parameter_schema", return_value={}),
             patch(f"waves.parameter_generators.{generator}", return_value=mock_generator) as mock_class,
+            patch.dict(_parameter_study._available_parameter_generators, {subcommand: mock_class}),
             does_not_raise(),
         ):
             _parameter_study.main(subcommand, "dummy.yaml")
@@ -115,9 +115,13 @@ def test_find_program(names, checkprog_side_effect, first_found_path):
     env = SCons.Environment.Environment()
 
     # Test function style interface
-    with patch("waves.scons_extensions.check_program", side_effect=checkprog_side_effect):
+    with patch("waves.scons_extensions.check_program", side_effect=checkprog_side_effect) as mock_check_program:
         program = scons_extensions.find_program(env, names)
     assert program == first_found_path
+    # Stop searching after the first found program
+    found = [path is not None for path in checkprog_side_effect]
+    expected_calls = found.index(True) + 1 if any(found) else len(found)
+    assert mock_check_program.call_count == expected_calls
 
     # Test SCons AddMethod style interface
     env.AddMethod(scons_extensions.find_program, "FindProgram")
@@ -2013,6 +2017,23 @@ def test_abaqus_input_scanner(content, expected_dependencies):
     assert set(found_files) == set(expected_dependencies)
 
 
+def test_custom_scanner_recursion():
+    """Check that only nodes matching the scanner suffixes are recursively scanned"""
+    scanner = scons_extensions._custom_scanner(r"^dummy=(.+)$", (suffix for suffix in [".inp", ".txt"]))
+    node_list = [unittest.mock.Mock(path=path) for path in ["dummy.inp", "dummy.out", "dummy.txt"]]
+    for _ in range(2):
+        recursive_nodes = scanner.recurse_nodes(node_list)
+        assert [node.path for node in recursive_nodes] == ["dummy.inp", "dummy.txt"]
+
+
+@pytest.mark.parametrize("scanner_factory", [scons_extensions.abaqus_input_scanner, scons_extensions.sphinx_scanner])
+def test_custom_scanner_add_skey(scanner_factory):
+    """Check that the public scanners accept additional scanner keys"""
+    scanner = scanner_factory()
+    scanner.add_skey(".dummy")
+    assert scanner.get_skeys()[-1] == ".dummy"
+
+
 sphinx_scanner_input = {
     # Test name, content, expected_dependencies
     "include directive": (".. include:: dummy.txt", ["dummy.txt"]),
@@ -617,7 +617,7 @@ def test_system(
             if isinstance(command, string.Template):
                 command = command.substitute(template_substitution)
             command = shlex.split(command, posix=not testing_windows)
-            subprocess.check_output(command, env=env, cwd=temp_path, text=True)
+            subprocess.run(command, env=env, cwd=temp_path, stdout=subprocess.DEVNULL, check=True)
     except Exception as err:
         raise err
     else:
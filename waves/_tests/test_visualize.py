@@ -1,13 +1,30 @@
+import io
 import pathlib
 from unittest.mock import patch
 
 import pytest
 import networkx
 import matplotlib.pyplot
+import matplotlib.patches
 
 from waves import _visualize
 
 
+def test_main():
+    """Check that the graphml output is printed to STDOUT as a complete document"""
+    tree_output = "[E b   C  ]+-nominal\n[  B      ]  +-build/nominal/stress_strain_comparison.pdf"
+    stdout = io.StringIO()
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("pathlib.Path.read_text", return_value=tree_output),
+        patch("sys.stdout", stdout),
+    ):
+        _visualize.main(["nominal"], input_file="dummy.txt", print_graphml=True)
+    graphml = stdout.getvalue()
+    graph = networkx.parse_graphml(graphml)
+    assert set(graph.nodes) == {"nominal", "build/nominal/stress_strain_comparison.pdf"}
+
+
 def test_ancestor_subgraph():
     graph = networkx.DiGraph()
     graph.add_edge("parent", "child")
@@ -63,6 +80,41 @@ def test_parse_output():
     assert "nominal" in graph.nodes
     assert "build/nominal/stress_strain_comparison.pdf" in graph.nodes
 
+    # Check for a runtime error on indentation jumps without a parent node
+    with pytest.raises(RuntimeError):
+        graph = _visualize.parse_output(["[E]+-top", "[E]    +-deep"])
+    with pytest.raises(RuntimeError):
+        graph = _visualize.parse_output(["[E]  +-deep"])
+
+    # Non-tree lines are skipped and nested nodes connect to the nearest lower indent
+    tree_output = (
+        "scons: Reading SConscript files ...\n"
+        "[E b   C  ]+-nominal\n"
+        "[  B      ]  +-build/nominal/stress_strain_comparison.pdf\n"
+        "scons: done building targets.\n"
+        "[E        ]  | +-build/nominal/stress_strain_comparison.csv"
+    )
+    graph = _visualize.parse_output(tree_output.split("\n"))
+    assert len(graph.nodes) == 3
+    assert ("build/nominal/stress_strain_comparison.csv", "build/nominal/stress_strain_comparison.pdf") in graph.edges
+
+    # Repeated subtrees of shared dependencies do not duplicate nodes or edges
+    repeated_output = f"{tree_output}\n[E        ]  +-build/nominal/stress_strain_comparison.pdf"
+    repeated_output = f"{repeated_output}\n[E        ]  | +-build/nominal/stress_strain_comparison.csv"
+    graph = _visualize.parse_output(repeated_output.split("\n"))
+    assert len(graph.nodes) == 3
+    assert len(graph.edges) == 2
+
+    # Prefix and suffix exclusions remove the node and its children
+    graph = _visualize.parse_output(tree_output.split("\n"), exclude_list=[".pdf"])
+    assert list(graph.nodes) == ["nominal"]
+    graph = _visualize.parse_output(tree_output.split("\n"), exclude_list=["build/nominal/stress_strain_comparison.c"])
+    assert len(graph.nodes) == 2
+    graph = _visualize.parse_output(tree_output.split("\n"), exclude_list=["nominal/"])
+    assert len(graph.nodes) == 3
+    graph = _visualize.parse_output(tree_output.split("\n"), exclude_list=[], exclude_regex=r"\.csv$")
+    assert len(graph.nodes) == 2
+
 
 def test_check_regex_exclude():
     """Test the regular expression exclusion of the visualize subcommand"""
@@ -81,7 +133,13 @@ def test_visualize():
     graph.add_node(1, label="one", layer=1)
     graph.add_node(2, label="two", layer=2)
     graph.add_edge(1, 2)
-    _visualize.visualize(graph)
+    figure = _visualize.visualize(graph)
+    axes = figure.axes[0]
+    assert len(axes.texts) == 2
+    arrows = [artist for artist in axes.patches if isinstance(artist, matplotlib.patches.FancyArrowPatch)]
+    assert len(arrows) == 1
+    # Match the annotation arrows, which are not clipped to the axes
+    assert arrows[0].get_clip_on() is False
 
 
 def test_plot():
@@ -79,12 +79,10 @@ def _quote_spaces_in_path(path: typing.Union[str, pathlib.Path]) -> pathlib.Path
     :return: Path with parts wrapped in double quotes as necessary
     """
     path = pathlib.Path(path)
-    new_path = pathlib.Path(path.root)
-    for part in path.parts:
-        if " " in part:
-            part = f'"{part}"'
-        new_path = new_path / part
-    return new_path
+    if " " not in str(path):
+        return path
+    parts = (f'"{part}"' if " " in part else part for part in path.parts)
+    return pathlib.Path(*parts)
 
 
 def search_commands(options: typing.Iterable[str]) -> typing.Optional[str]:
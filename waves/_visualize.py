@@ -12,14 +12,21 @@ import sys
 import re
 import io
 
-import networkx
-import matplotlib.pyplot
-
 from waves import _settings
 
+# Networkx and matplotlib are slow to import and only required by the visualize subcommand. Import them in the
+# functions that use them to keep the CLI start up fast for all other subcommands.
+if typing.TYPE_CHECKING:
+    import networkx
+    import matplotlib.figure
+
 
 _exclude_from_namespace = set(globals().keys())
 
+# Status characters without brackets, indent placement of spaces and pipes, and the node name. The bounded character
+# classes avoid the greedy ``.*`` backtracking to the last bracket and last ``+-`` of every line.
+_tree_line_regex = re.compile(r"^\[([^\]\n]*)\]([ |]*)\+-(.*)", re.MULTILINE)
+
 
 def get_parser() -> argparse.ArgumentParser:
     """Return a 'no-help' parser for the visualize subcommand
@@ -244,9 +251,9 @@ def main(
 
 
 def ancestor_subgraph(
-    graph: networkx.DiGraph,
+    graph: "networkx.DiGraph",
     nodes: typing.Iterable[str],
-) -> networkx.DiGraph:
+) -> "networkx.DiGraph":
     """Return a new directed graph containing nodes and their ancestors
 
     :param graph: original directed graph
@@ -256,6 +263,8 @@ def ancestor_subgraph(
 
     :raises RuntimeError: If one or more nodes are missing from the graph
     """
+    import networkx
+
     sources = set(nodes)
     missing = list()
     for node in nodes:
@@ -270,7 +279,7 @@ def ancestor_subgraph(
     return networkx.DiGraph(graph.subgraph(sources))
 
 
-def add_node_count(graph: networkx.DiGraph, text: str = "Node count: ") -> networkx.DiGraph:
+def add_node_count(graph: "networkx.DiGraph", text: str = "Node count: ") -> "networkx.DiGraph":
     """Add an orphan node with the total node count to a directed graph
 
     The graph nodes must contain a ``layer`` attribute with integer values. Orphan node is assigned to the minimum
@@ -286,11 +295,13 @@ def add_node_count(graph: networkx.DiGraph, text: str = "Node count: ") -> netwo
     return graph
 
 
-def graph_to_graphml(graph: networkx.DiGraph) -> str:
+def graph_to_graphml(graph: "networkx.DiGraph") -> str:
     """Return the networkx graphml text
 
     :param graph: networkx directed graph
     """
+    import networkx
+
     with io.BytesIO() as graphml_buffer:
         networkx.write_graphml_lxml(graph, graphml_buffer)
         graphml = graphml_buffer.getvalue().decode("utf-8")
@@ -302,7 +313,7 @@ def parse_output(
     exclude_list: typing.List[str] = _settings._visualize_exclude,
     exclude_regex: typing.Optional[str] = None,
     no_labels: bool = False,
-) -> networkx.DiGraph:
+) -> "networkx.DiGraph":
     """Parse the string that has the tree output and return as a networkx directed graph
 
     :param tree_lines: output of the scons tree command pre-split on newlines to a list of strings
@@ -312,44 +323,55 @@ def parse_output(
 
     :returns: networkx directed graph
 
-    :raises RuntimeError: If the parsed input doesn't contain recognizable SCons nodes
+    :raises RuntimeError: If the parsed input doesn't contain recognizable SCons nodes or a node is indented more than
+        one level below its parent node
     """
+    import networkx
+
     graph = networkx.DiGraph()
-    higher_nodes = dict()
+    higher_nodes: typing.List[str] = list()
     exclude_node = False
     exclude_indent = 0
-    for line in tree_lines:
-        line_match = re.match(r"^\[(.*)\](.*)\+-(.*)", line)
-        if line_match:
-            status = [_settings._scons_tree_status[_] for _ in line_match.group(1) if _.strip()]
-            placement = line_match.group(2)
-            node_name = line_match.group(3)
-            current_indent = int(len(placement) / 2) + 1
-            if current_indent <= exclude_indent and exclude_node:
-                exclude_node = False
-            if exclude_node:
-                continue
-            for exclude in exclude_list:
-                if node_name.startswith(exclude) or node_name.endswith(exclude):
-                    exclude_node = True
-                    exclude_indent = current_indent
-            exclude_node, exclude_indent = check_regex_exclude(
-                exclude_regex, node_name, current_indent, exclude_indent, exclude_node
-            )
-            if exclude_node:
-                continue
-
-            if no_labels:
-                label = " "
-            else:
-                label = node_name
-
-            if node_name not in graph.nodes:
-                graph.add_node(node_name, label=label, layer=current_indent)
-            higher_nodes[current_indent] = node_name
+    # String methods accept a tuple of prefixes/suffixes and test all of them in one call. Compile the regex once.
+    exclude_tuple = tuple(exclude_list)
+    exclude_regex_pattern = re.compile(exclude_regex) if exclude_regex else None
+    # Scan the joined text once with a multiline pattern instead of matching each line in Python
+    for line_match in _tree_line_regex.finditer("\n".join(tree_lines)):
+        status = [_settings._scons_tree_status[_] for _ in line_match.group(1) if _.strip()]
+        placement = line_match.group(2)
+        node_name = line_match.group(3)
+        current_indent = len(placement) // 2 + 1
+        if current_indent <= exclude_indent and exclude_node:
+            exclude_node = False
+        if exclude_node:
+            continue
+        if node_name.startswith(exclude_tuple) or node_name.endswith(exclude_tuple):
+            exclude_node = True
+            exclude_indent = current_indent
+        exclude_node, exclude_indent = check_regex_exclude(
+            exclude_regex_pattern, node_name, current_indent, exclude_indent, exclude_node
+        )
+        if exclude_node:
+            continue
 
-            if current_indent != 1:  # If it's not the first node which is the top level node
-                higher_node = higher_nodes[current_indent - 1]
+        if no_labels:
+            label = " "
+        else:
+            label = node_name
+
+        # Most recent node for each indent level, indexed by ``current_indent - 1``
+        level = current_indent - 1
+        if level > len(higher_nodes):
+            raise RuntimeError(f"Node '{node_name}' is indented more than one level below its parent node")
+        if node_name not in graph:
+            graph.add_node(node_name, label=label, layer=current_indent)
+        del higher_nodes[level:]
+        higher_nodes.append(node_name)
+
+        if current_indent != 1:  # If it's not the first node which is the top level node
+            higher_node = higher_nodes[level - 1]
+            # SCons repeats the full subtree of shared dependencies. Skip edges that are already in the graph.
+            if not graph.has_edge(node_name, higher_node):
                 graph.add_edge(node_name, higher_node)
 
     # If SCons tree or input_file is not in the expected format the nodes will be empty
@@ -364,7 +386,7 @@ def parse_output(
 
 
 def check_regex_exclude(
-    exclude_regex: str,
+    exclude_regex: typing.Union[str, typing.Pattern, None],
     node_name: str,
     current_indent: int,
     exclude_indent: int,
@@ -372,7 +394,7 @@ def check_regex_exclude(
 ) -> typing.Tuple[bool, int]:
     """Excludes node names that match the regular expression
 
-    :param str exclude_regex: Regular expression
+    :param exclude_regex: Regular expression string or compiled pattern
     :param str node_name: Name of the node
     :param int current_indent: Current indent of the parsed output
     :param int exclude_indent: Set to current_indent if node is to be excluded
@@ -387,14 +409,14 @@ def check_regex_exclude(
 
 
 def visualize(
-    graph: networkx.DiGraph,
+    graph: "networkx.DiGraph",
     height: int = _settings._visualize_default_height,
     width: int = _settings._visualize_default_width,
     font_size: int = _settings._visualize_default_font_size,
     node_color: str = _settings._default_node_color,
     edge_color: str = _settings._default_edge_color,
     vertical: bool = False,
-) -> matplotlib.figure.Figure:
+) -> "matplotlib.figure.Figure":
     """Create a visualization showing the tree
 
     Nodes in graph require the ``layer`` and ``label`` attributes.
@@ -405,6 +427,10 @@ def visualize(
     :param font_size: Font size of file names in points
     :param vertical: Specifies a vertical layout of graph instead of the default horizontal layout
     """
+    import networkx
+    import matplotlib.patches
+    import matplotlib.text
+
     multipartite_kwargs = dict(align="vertical")
     if vertical:
         multipartite_kwargs.update({"align": "horizontal"})
@@ -429,21 +455,27 @@ def visualize(
             bbox=dict(facecolor=node_color, boxstyle="round"),
         )
 
+    # Draw bare arrow patches instead of empty text annotations to avoid one Text artist per edge. Match the annotation
+    # arrow head size, which scales with the annotation font size, the annotation draw order, and the unclipped
+    # annotation arrows, which may bulge past the axes limits.
+    arrow_style = dict(
+        arrowstyle="<-",
+        color=edge_color,
+        connectionstyle="arc3,rad=0.1",
+        mutation_scale=matplotlib.rcParams["font.size"],
+        transform=axes.transData,
+        zorder=matplotlib.text.Text.zorder,
+        clip_on=False,
+    )
     for source, target in graph.edges:
-        patchA = annotations[target]
-        patchB = annotations[source]
-
-        arrowprops = dict(
-            arrowstyle="<-", color=edge_color, connectionstyle="arc3,rad=0.1", patchA=patchA, patchB=patchB
-        )
-        axes.annotate(
-            "",
-            xy=node_positions[source],
-            xycoords="data",
-            xytext=node_positions[target],
-            textcoords="data",
-            arrowprops=arrowprops,
+        arrow = matplotlib.patches.FancyArrowPatch(
+            posA=node_positions[target],
+            posB=node_positions[source],
+            patchA=annotations[target],
+            patchB=annotations[source],
+            **arrow_style,
         )
+        axes.add_artist(arrow)
 
     figure.set_size_inches((width, height))
 
@@ -451,7 +483,7 @@ def visualize(
 
 
 def plot(
-    figure: matplotlib.figure.Figure,
+    figure: "matplotlib.figure.Figure",
     output_file: typing.Optional[pathlib.Path] = None,
     transparent: bool = False,
 ) -> None:
@@ -461,6 +493,8 @@ def plot(
     :param output_file: File for saving the visualization
     :param transparent: Use a transparent background
     """
+    import matplotlib.pyplot
+
     if output_file is not None:
         file_name = output_file
         file_name.parent.mkdir(parents=True, exist_ok=True)
@@ -32,6 +32,12 @@ def test_combine_data():
         combined_data = utilities.combine_data(input_files, "/", SET_COORDINATE_KEY)
     assert combined_data.equals(expected)
 
+    # Unrequested data variables are dropped before concatenation
+    xarray_side_effect = [dataset.assign(other_name=dataset["variable_name"] * 2) for dataset in [dataset1, dataset2]]
+    with unittest.mock.patch("xarray.open_dataset", side_effect=xarray_side_effect):
+        combined_data = utilities.combine_data(input_files, "/", SET_COORDINATE_KEY, variables=["variable_name"])
+    assert combined_data.equals(expected)
+
 
 def test_merge_parameter_study():
     """Test the Python 3 Xarray Dataset and WAVES parameter study merge utility
@@ -126,3 +132,14 @@ def test_csv_files_match():
 
     # Assert that the function returns True when the sorted DataFrames are identical
     assert utilities.csv_files_match(control, unsorted_copy, sort_columns=["time"]) is True
+
+    # Assert that the function returns True when the DataFrames match within the floating point tolerance
+    float_control = control.astype({"Column1": float})
+    tolerance_copy = float_control.copy()
+    tolerance_copy.loc[0, "Column1"] += 1.0e-9
+    assert utilities.csv_files_match(float_control, tolerance_copy, sort_columns=["time"]) is True
+
+    # Assert that the function returns False when only the index type differs
+    integer_time = control.astype({"time": int})
+    float_time = integer_time.astype({"time": float})
+    assert utilities.csv_files_match(integer_time, float_time, sort_columns=["time"]) is False
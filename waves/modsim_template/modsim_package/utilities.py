@@ -11,13 +11,15 @@ import xarray
 import matplotlib.pyplot
 
 
-def combine_data(input_files, group_path, concat_coord):
+def combine_data(input_files, group_path, concat_coord, variables=None):
     """Combine input data files into one dataset
 
     :param list input_files: list of path-like or file-like objects pointing to h5netcdf files
         containing Xarray Datasets
     :param str group_path: The h5netcdf group path locating the Xarray Dataset in the input files.
     :param str concat_coord: Name of dimension
+    :param list variables: Data variable names to keep. Defaults to all data variables. Other data variables are dropped
+        before concatenation, so they are never read from the input files.
 
     :returns: Combined data
     :rtype: xarray.DataArray
@@ -26,6 +28,8 @@ def combine_data(input_files, group_path, concat_coord):
     data_generator = (
         xarray.open_dataset(path, group=group_path).assign_coords({concat_coord: path.parent.name}) for path in paths
     )
+    if variables is not None:
+        data_generator = (dataset[variables] for dataset in data_generator)
     combined_data = xarray.concat(data_generator, concat_coord)
     combined_data.close()
 
@@ -100,6 +104,9 @@ def csv_files_match(current_csv, expected_csv, index_column="time", sort_columns
     """
     current = sort_dataframe(current_csv, index_column=index_column, sort_columns=sort_columns)
     expected = sort_dataframe(expected_csv, index_column=index_column, sort_columns=sort_columns)
+    # Exactly equal data skips the slower, tolerance based comparison. DataFrame.equals ignores the index type.
+    if current.index.dtype == expected.index.dtype and current.equals(expected):
+        return True
     try:
         pandas.testing.assert_frame_equal(current, expected)
     except AssertionError as err:
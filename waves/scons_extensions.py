@@ -1,6 +1,5 @@
 import re
 import sys
-import copy
 import atexit
 import shutil
 import typing
@@ -411,9 +410,9 @@ def default_targets_message(
         overwritten if ``env.Help`` has not been previously called.
     :param keep_local: Limit help message to the project specific content when True. Only applies to SCons >=4.6.0
     """
-    default_targets_help = "\nDefault Targets:\n"
-    for target in SCons.Script.DEFAULT_TARGETS:
-        default_targets_help += f"    {str(target)}\n"
+    default_targets_help = "\nDefault Targets:\n" + "".join(
+        f"    {str(target)}\n" for target in SCons.Script.DEFAULT_TARGETS
+    )
     try:
         SConsEnvironment.Help(env, default_targets_help, append=append, keep_local=keep_local)
     except TypeError as err:
@@ -442,9 +441,7 @@ def alias_list_message(
         overwritten if ``env.Help`` has not been previously called.
     :param keep_local: Limit help message to the project specific content when True. Only applies to SCons >=4.6.0
     """
-    alias_help = "\nTarget Aliases:\n"
-    for alias in SCons.Node.Alias.default_ans:
-        alias_help += f"    {alias}\n"
+    alias_help = "\nTarget Aliases:\n" + "".join(f"    {alias}\n" for alias in SCons.Node.Alias.default_ans)
     try:
         SConsEnvironment.Help(env, alias_help, append=append, keep_local=keep_local)
     except TypeError:
@@ -540,8 +537,8 @@ def find_program(
 ) -> str:
     """Search for a program from a list of possible program names.
 
-    Returns the absolute path of the first program name found. If path parts contain spaces, the part will be wrapped in
-    double quotes.
+    Returns the absolute path of the first program name found. Names after the first found program are not searched. If
+    path parts contain spaces, the part will be wrapped in double quotes.
 
     .. code-block::
        :caption: Example search for an executable named "program"
@@ -559,11 +556,12 @@ def find_program(
     """
     if isinstance(names, str):
         names = [names]
-    program_paths = []
-    for name in names:
-        program_paths.append(check_program(env, name))
     # Return first non-None path. Default to None if no program path was found.
-    first_found_path = next((path for path in program_paths if path is not None), None)
+    first_found_path = None
+    for name in names:
+        first_found_path = check_program(env, name)
+        if first_found_path is not None:
+            break
     if first_found_path:
         first_found_path = str(_utilities._quote_spaces_in_path(first_found_path))
 
@@ -1257,26 +1255,28 @@ def _abaqus_solver_emitter(
 
     :return: target, source
     """
-    suffixes_copy = copy.deepcopy(suffixes)
     if "suffixes" in env and env["suffixes"] is not None:
-        suffixes_copy = copy.deepcopy(env["suffixes"])
+        suffixes = env["suffixes"]
     primary_input_file = pathlib.Path(source[0].path)
     if "job_name" not in env or not env["job_name"]:
         env["job_name"] = primary_input_file.stem
-    if isinstance(suffixes_copy, str):
-        suffixes_copy = [suffixes_copy]
-    suffixes_copy.append(_settings._abaqus_environment_extension)
+    if isinstance(suffixes, str):
+        suffixes = [suffixes]
+    # Shallow copy is sufficient for the immutable suffix strings. Avoid modifying the default or environment list.
+    suffixes_copy = [*suffixes, _settings._abaqus_environment_extension]
     build_subdirectory = _build_subdirectory(target)
 
     # Search for a user specified stdout file. Fall back to job name with appended stdout extension
     string_targets = [str(target_file) for target_file in target]
-    constructed_stdout_target = str(build_subdirectory / f"{env['job_name']}{stdout_extension}")
+    # Build the job path once and append each suffix to the string
+    job_path = str(build_subdirectory / env["job_name"])
+    constructed_stdout_target = f"{job_path}{stdout_extension}"
     stdout_target = next(
         (target_file for target_file in string_targets if target_file.endswith(stdout_extension)),
         constructed_stdout_target,
     )
 
-    job_targets = [str(build_subdirectory / f"{env['job_name']}{suffix}") for suffix in suffixes_copy]
+    job_targets = [f"{job_path}{suffix}" for suffix in suffixes_copy]
 
     # Get a list of unique targets,  less the stdout target. Preserve the target list order.
     string_targets = string_targets + job_targets
@@ -1304,6 +1304,13 @@ def _abaqus_datacheck_solver_emitter(target: list, source: list, env) -> typing.
     return _abaqus_solver_emitter(target, source, env, _settings._abaqus_datacheck_extensions)
 
 
+_abaqus_solver_emitters = {
+    "standard": _abaqus_standard_solver_emitter,
+    "explicit": _abaqus_explicit_solver_emitter,
+    "datacheck": _abaqus_datacheck_solver_emitter,
+}
+
+
 def abaqus_solver(
     program: str = "abaqus",
     required: str = "-interactive -ask_delete no -job ${job_name} -input ${SOURCE.filebase}",
@@ -1400,16 +1407,9 @@ def abaqus_solver(
         "${action_prefix} ${program} -information environment ${environment_suffix}",
         "${action_prefix} ${program} ${required} ${abaqus_options} ${action_suffix}",
     ]
-    if emitter:
-        emitter = emitter.lower()
-    if emitter == "standard":
-        abaqus_emitter = _abaqus_standard_solver_emitter
-    elif emitter == "explicit":
-        abaqus_emitter = _abaqus_explicit_solver_emitter
-    elif emitter == "datacheck":
-        abaqus_emitter = _abaqus_datacheck_solver_emitter
-    else:
-        abaqus_emitter = _abaqus_solver_emitter
+    abaqus_emitter = (
+        _abaqus_solver_emitters.get(emitter.lower(), _abaqus_solver_emitter) if emitter else _abaqus_solver_emitter
+    )
     abaqus_solver_builder = SCons.Builder.Builder(
         action=action,
         emitter=abaqus_emitter,
@@ -2115,12 +2115,13 @@ def _abaqus_extract_emitter(
 
     :return: target, source
     """
-    odb_file = pathlib.Path(source[0].path).name
-    odb_file = pathlib.Path(odb_file)
+    odb_file = pathlib.Path(source[0].path)
     build_subdirectory = _build_subdirectory(target)
-    if not target or pathlib.Path(str(target[0])).suffix != ".h5":
-        target.insert(0, str(build_subdirectory / odb_file.with_suffix(".h5")))
-    first_target = pathlib.Path(str(target[0]))
+    # Parse the first target once and reuse it for the emitted target names
+    first_target = pathlib.Path(str(target[0])) if target else None
+    if first_target is None or first_target.suffix != ".h5":
+        first_target = build_subdirectory / odb_file.with_suffix(".h5").name
+        target.insert(0, str(first_target))
     target.append(f"{build_subdirectory / first_target.stem}_datasets.h5")
     if "delete_report_file" not in env or not env["delete_report_file"]:
         target.append(str(build_subdirectory / first_target.with_suffix(".csv").name))
@@ -2212,18 +2213,10 @@ def _build_odb_extract(
     :param source: The source file list of SCons.Node.FS.File objects
     :param env: The builder's SCons construction environment object
     """
-    # Default odb_extract arguments
-    output_type = "h5"
-    odb_report_args = None
-    delete_report_file = False
-
-    # Grab arguments from environment if they exist
-    if "output_type" in env:
-        output_type = env["output_type"]
-    if "odb_report_args" in env:
-        odb_report_args = env["odb_report_args"]
-    if "delete_report_file" in env:
-        delete_report_file = env["delete_report_file"]
+    # Grab arguments from environment if they exist. Fall back to the default odb_extract arguments.
+    output_type = env.get("output_type", "h5")
+    odb_report_args = env.get("odb_report_args", None)
+    delete_report_file = env.get("delete_report_file", False)
 
     # Remove existing target files that are not overwritten by odb_extract
     files_to_remove = [pathlib.Path(path.abspath) for path in target]
@@ -2454,6 +2447,7 @@ def _custom_scanner(
     """
     flags = re.MULTILINE if not flags else re.MULTILINE | flags
     expression = re.compile(pattern, flags)
+    suffix_tuple = tuple(suffixes)
 
     def suffix_only(node_list: list) -> list:
         """Recursively search for files that end in the given suffixes
@@ -2462,7 +2456,7 @@ def _custom_scanner(
 
         :return: List of file dependencies to include for recursive scanning
         """
-        return [node for node in node_list if node.path.endswith(tuple(suffixes))]
+        return [node for node in node_list if node.path.endswith(suffix_tuple)]
 
     def regex_scan(node: SCons.Node.FS, env: SCons.Environment.Environment, path: str) -> list:
         """Scan function for extracting dependencies from the content of a file based on the given regular expression.
@@ -2482,7 +2476,7 @@ def _custom_scanner(
         includes = [file.strip() for file in includes]
         return includes
 
-    custom_scanner = SCons.Scanner.Scanner(function=regex_scan, skeys=suffixes, recursive=suffix_only)
+    custom_scanner = SCons.Scanner.Scanner(function=regex_scan, skeys=list(suffix_tuple), recursive=suffix_only)
     return custom_scanner
 
 
@@ -3335,8 +3329,6 @@ def parameter_study_sconscript(
     from waves import parameter_generators
 
     if not isinstance(exports, dict):
-        import warnings
-
         message = (
             f"``exports`` keyword argument {exports} *must* be a dictionary of '{{key: value}}' pairs because "
             "this function does not have access to the calling script's namespace."
@@ -31,6 +31,9 @@ def csv_files_match(current_csv, expected_csv, index_column="time", sort_columns
     """
     current = sort_dataframe(current_csv, index_column=index_column, sort_columns=sort_columns)
     expected = sort_dataframe(expected_csv, index_column=index_column, sort_columns=sort_columns)
+    # Exactly equal data skips the slower, tolerance based comparison. DataFrame.equals ignores the index type.
+    if current.index.dtype == expected.index.dtype and current.equals(expected):
+        return True
     try:
         pandas.testing.assert_frame_equal(current, expected)
     except AssertionError as err:
@@ -43,3 +43,14 @@ def test_csv_files_match():
 
     # Assert that the function returns True when the sorted DataFrames are identical
     assert regression.csv_files_match(control, unsorted_copy, sort_columns=["time"]) is True
+
+    # Assert that the function returns True when the DataFrames match within the floating point tolerance
+    float_control = control.astype({"Column1": float})
+    tolerance_copy = float_control.copy()
+    tolerance_copy.loc[0, "Column1"] += 1.0e-9
+    assert regression.csv_files_match(float_control, tolerance_copy, sort_columns=["time"]) is True
+
+    # Assert that the function returns False when only the index type differs
+    integer_time = control.astype({"time": int})
+    float_time = integer_time.astype({"time": float})
+    assert regression.csv_files_match(integer_time, float_time, sort_columns=["time"]) is False